@@ -30,6 +30,9 @@ msg={{COLOR_RED}}Your name is {name}{{COLOR_NONE}}
 
 (do not forget to turn off the color with {{COLOR_NONE}} at the end or your next text will still be the same color)
 
+A literal \\n in either error codes or messages is converted into a newline. Other than that, values are used exactly as
+written: there is no %-style interpolation, so a literal % does not need to be escaped as %%.
+
 An example of usage:
 
 Assuming a resource file that looks like the following:
@@ -42,10 +45,19 @@ The following code shows how to use this system:
 localized_resource_obj = LocalizedResource("/path/to/resource/", "myapp", "english")
 msg = localized_resource_obj.get_error_msg(101)
 msg = msg.format(replace_me="some text to fill into the replace_me variable")
+
+or, fetching the string and filling in its variables in a single call:
+
+msg = localized_resource_obj.format_error_msg(101, replace_me="some text to fill into the replace_me variable")
 """
 
-import configparser
+import importlib.util
+import mmap
 import os
+import re
+import sys
+import types
+import warnings
 
 from bvzlocalizationerror import LocalizationError
 
@@ -69,18 +81,94 @@ BRIGHT_CYAN = '\033[96m'
 BRIGHT_WHITE = '\033[97m'
 ENDC = '\033[0m'
 
+# map each substitution token to its replacement, and build a single regex that matches any of them. The regex is
+# compiled once, here, and spells out the color alternation explicitly so that the shared "{{COLOR_" prefix is only
+# matched once per token.
+#
+# Escape sequences (currently only a literal \n) are kept apart from the colors in _ESCAPE_MAP, and handled by the same
+# regex rather than by a separate pass over the string. A new escape (\t for example) only needs adding to _ESCAPE_MAP:
+# _COLOR_MAP and _COLOR_SUB pick it up from there. It must start with a backslash, because the fast path at the top of
+# LocalizedResource._format_string skips any string that contains neither "{{" nor a backslash. A new color needs adding
+# to _COLOR_MAP and to the alternation in _COLOR_SUB.
+# ----------------------------------------------------------------------------------------------------------------------
+_ESCAPE_MAP = {
+    r"\n": "\n",
+}
+_COLOR_MAP = {
+    **_ESCAPE_MAP,
+    "{{COLOR_BLACK}}": BLACK,
+    "{{COLOR_RED}}": RED,
+    "{{COLOR_GREEN}}": GREEN,
+    "{{COLOR_YELLOW}}": YELLOW,
+    "{{COLOR_BLUE}}": BLUE,
+    "{{COLOR_MAGENTA}}": MAGENTA,
+    "{{COLOR_CYAN}}": CYAN,
+    "{{COLOR_WHITE}}": WHITE,
+    "{{COLOR_BRIGHT_RED}}": BRIGHT_RED,
+    "{{COLOR_BRIGHT_GREEN}}": BRIGHT_GREEN,
+    "{{COLOR_BRIGHT_YELLOW}}": BRIGHT_YELLOW,
+    "{{COLOR_BRIGHT_BLUE}}": BRIGHT_BLUE,
+    "{{COLOR_BRIGHT_MAGENTA}}": BRIGHT_MAGENTA,
+    "{{COLOR_BRIGHT_CYAN}}": BRIGHT_CYAN,
+    "{{COLOR_BRIGHT_WHITE}}": BRIGHT_WHITE,
+    "{{COLOR_NONE}}": ENDC,
+}
+_COLOR_SUB = re.compile("|".join(re.escape(escape) for escape in _ESCAPE_MAP) + "|" +
+                        r"\{\{COLOR_(?:BLACK|RED|GREEN|YELLOW|BLUE|MAGENTA|CYAN|WHITE|BRIGHT_RED|BRIGHT_GREEN|"
+                        r"BRIGHT_YELLOW|BRIGHT_BLUE|BRIGHT_MAGENTA|BRIGHT_CYAN|BRIGHT_WHITE|NONE)\}\}")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _expand_token(match, _map=_COLOR_MAP):
+    """
+    re.sub callback that replaces a matched token with its color code (or escaped character). Each match costs one call
+    to this plain function, which is passed to re.sub directly (not wrapped in a lambda or functools.partial, both of
+    which add a call layer per match). The map is bound as a default argument so that the lookup needs no global
+    lookups.
+
+    :param match:
+            The match object for the token.
+    :param _map:
+            Not meant to be passed. Binds _COLOR_MAP as a local.
+
+    :return:
+            The replacement string.
+    """
+
+    return _map[match[0]]
+
+
+# regex used to parse the (undecoded) resources file. Only [section] headers, key=value lines and bare keys are
+# supported. Each match is one line: group 1 is a section name, groups 2 and 3 are a key and its value, group 4 is a key
+# without a value, and group 5 is any other line, which is not supported (key: value lines, indented continuation lines,
+# etc.). Blank lines and lines starting with # or ; never match, so they are skipped by the regex engine.
+# ----------------------------------------------------------------------------------------------------------------------
+_LINE_RE = re.compile(rb"^(?:"
+                      rb"[ \t]*\[([^\]\r\n]+)\]"
+                      rb"|([^=:\s#;][^=:\r\n]*?)[ \t]*=[ \t]*([^\r\n]*?)"
+                      rb"|([^=:\s#;][^=:\r\n]*?)"
+                      rb"|([ \t]*[^\s#;][^\r\n]*?)"
+                      rb")[ \t]*\r?$", re.MULTILINE)
+
+# parsed resources files, shared between all LocalizedResource objects. Keyed on the absolute path of the file, each
+# entry is a list of [mtime in ns, size, sections, formatted sections, flat map] so that a file which has been edited is
+# parsed again. The formatted sections are None until every value has been formatted, and the flat map holds whichever
+# values have been formatted so far.
+# ----------------------------------------------------------------------------------------------------------------------
+_PARSE_CACHE = dict()
+
 
 # ======================================================================================================================
-class LocalizedResource(configparser.SafeConfigParser):
+class LocalizedResource(object):
     """
-    A Class to manage the localized resources file. Subclassed from the default python config parser. Note, all error
-    messages are presented in English because by definition no language file has been loaded yet.
+    A Class to manage the localized resources file. Note, all error messages are presented in English because by
+    definition no language file has been loaded yet.
     """
 
     # ------------------------------------------------------------------------------------------------------------------
-    def __init__(self, resources_d, prefix, language="english"):
+    def __init__(self, resources_d, prefix, language="english", lazy=False, compiled=False):
         """
-        Setup this subclass of the default python config parser.
+        Setup the localized resources object.
 
         :param resources_d:
                 The directory where the localized resources files are stored.
@@ -89,6 +177,13 @@ class LocalizedResource(configparser.SafeConfigParser):
                 resources file, the prefix would be: "squirrel". Required.
         :param language:
                 The language to use when parsing the resources file. If no language is supplied, defaults to "english".
+        :param lazy:
+                If True, values are only formatted the first time they are requested instead of all at once when the
+                resources file is read. Useful for very large resources files of which only a few strings are ever
+                used. Defaults to False.
+        :param compiled:
+                If True, use the compiled version of the resources file (see bvzlocalizationcompile) whenever it is up
+                to date, instead of parsing the .ini file. Defaults to False.
 
         :return:
                 Nothing.
@@ -96,41 +191,294 @@ class LocalizedResource(configparser.SafeConfigParser):
 
         assert type(resources_d) is str
 
-        if not os.path.exists(resources_d):
-            raise LocalizationError(f"Resources directory {resources_d} does not exist.")
-
-        configparser.SafeConfigParser.__init__(self, allow_no_value=True)
-
         self.resources_d = resources_d
         self.resources_n = prefix + "_" + language + ".ini"
         self.resources_p = os.path.join(self.resources_d, self.resources_n)
-        self._read_resources()
+
+        # The resources file is only read once, so messages may be cached by the key the caller used to request them
+        # without ever being invalidated.
+        self._err_cache = dict()
+        self._msg_cache = dict()
+
+        self._sections = dict()
+        self._formatted = None
+        self._flat = dict()
+        self._cache_entry = None
+        self._read_resources(compiled)
+
+        if not lazy:
+            self._format_all()
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _read_resources(self):
+    def _read_resources(self, compiled=False):
         """
         Opens up the appropriate localized resource .ini file and reads its contents.
 
+        :param compiled:
+                If True, load the compiled version of the resources file instead if it is up to date.
+
         :return:
                 Nothing.
         """
 
         # If this file does not exist, warn the user and bail. Since we cannot find a language yet, report the error in
-        # English.
-        if not os.path.exists(self.resources_p):
+        # English. A single stat both checks that the file exists and tells us whether it has changed since it was last
+        # parsed. Only if it fails do we bother to check whether the directory is what is missing.
+        try:
+            st = os.stat(self.resources_p)
+        except (FileNotFoundError, NotADirectoryError):
+            if not os.path.exists(self.resources_d):
+                raise LocalizationError(f"Resources directory {self.resources_d} does not exist.")
             msg = "Cannot locate resource file: " + os.path.abspath(self.resources_p)
             code = 1
             raise LocalizationError(msg, code)
+        except OSError as e:
+            msg = f"Cannot read resource file: {os.path.abspath(self.resources_p)} ({e.strerror})"
+            raise LocalizationError(msg, 1)
+
+        # Reuse the results of any previous parse of this file, as long as it has not changed since.
+        cache_key = os.path.abspath(self.resources_p)
+        entry = _PARSE_CACHE.get(cache_key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self._cache_entry = entry
+            self._sections, self._formatted, self._flat = entry[2:]
+            return
+
+        # If asked to, prefer a compiled version of the resources file (see bvzlocalizationcompile) as long as it is up
+        # to date. Its values are already formatted, so there is nothing left to do.
+        module = self._load_compiled_resources(st) if compiled else None
+        if module is not None:
+            self._sections = module.SECTIONS
+            self._formatted = module.FORMATTED
+            self._flat = {(section, key): value
+                          for section, options in self._formatted.items()
+                          for key, value in options.items()}
+            self._cache_entry = [st.st_mtime_ns, st.st_size, self._sections, self._formatted, self._flat]
+            _PARSE_CACHE[cache_key] = self._cache_entry
+            return
+
+        # Map the whole file into memory in one go and parse it as bytes. Empty files cannot be mapped.
+        try:
+            fd = os.open(self.resources_p, os.O_RDONLY)
+        except OSError as e:
+            msg = f"Cannot read resource file: {os.path.abspath(self.resources_p)} ({e.strerror})"
+            raise LocalizationError(msg, 1)
+
+        try:
+            if st.st_size == 0:
+                self._sections = dict()
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as data:
+                    self._sections = self._parse_resources(data)
+        except UnicodeDecodeError as e:
+            msg = f"Localization file {self.resources_p} is corrupt: It is not encoded as utf-8 ({e.reason})."
+            raise LocalizationError(msg, 6)
+        finally:
+            os.close(fd)
+
+        self._cache_entry = [st.st_mtime_ns, st.st_size, self._sections, None, self._flat]
+        _PARSE_CACHE[cache_key] = self._cache_entry
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _load_compiled_resources(self, st):
+        """
+        Loads the compiled version of the resources file: a python module with the same name as the .ini file, written
+        next to it by bvzlocalizationcompile. The module is only used if it was compiled from a file with exactly the
+        same modification time and size as the .ini file. A missing or out of date module is ignored so that the .ini
+        file is parsed instead. So is a module that cannot be loaded, but with a warning, since it should not exist.
+
+        :param st:
+                The os.stat result of the .ini file.
+
+        :return:
+                The compiled module, or None if there is no up to date compiled module.
+        """
+
+        compiled_n = os.path.splitext(self.resources_n)[0]
+        compiled_p = os.path.join(self.resources_d, compiled_n + ".py")
+
+        # Most resources are never compiled, so check for the module before paying for an import.
+        if not os.path.isfile(compiled_p):
+            return None
+
+        try:
+            spec = importlib.util.spec_from_file_location(compiled_n, compiled_p)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            warnings.warn(f"Ignoring compiled resources {compiled_p}, which cannot be loaded: {e!r}", RuntimeWarning)
+            return None
+
+        if getattr(module, "SOURCE_MTIME_NS", None) != st.st_mtime_ns:
+            return None
+
+        if getattr(module, "SOURCE_SIZE", None) != st.st_size:
+            return None
+
+        if type(getattr(module, "SECTIONS", None)) is not dict or type(getattr(module, "FORMATTED", None)) is not dict:
+            return None
+
+        return module
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _format_all(self):
+        """
+        Formats every value in the resources file, unless that has already been done. Values never change once the
+        file has been read, so after this the getters never need to format anything again. Keys without a value have
+        nothing to format and are left out.
+
+        :return:
+                Nothing.
+        """
+
+        # Another object reading the same file may already have done the work.
+        self._formatted = self._cache_entry[3]
+        if self._formatted is not None:
+            return
+
+        self._formatted = {section: {key: self._format_string(value)
+                                     for key, value in options.items() if value is not None}
+                           for section, options in self._sections.items()}
+
+        # The flat (section, key) -> value map lets the getters find a value with a single dictionary lookup.
+        self._flat.update(((section, key), value)
+                          for section, options in self._formatted.items()
+                          for key, value in options.items())
+
+        self._cache_entry[3] = self._formatted
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _format_value(self, section, key):
+        """
+        Returns the formatted value of a key, formatting it (and remembering the result) if that has not been done yet.
+        Keys are case insensitive.
+
+        :param section:
+                The name of the section.
+        :param key:
+                The key whose value should be returned.
+
+        :return:
+                The formatted value, or None if the section or key does not exist or the key has no value.
+        """
+
+        key = key.lower()
+
+        msg = self._flat.get((section, key))
+        if msg is None:
+            value = self._sections.get(section, {}).get(key)
+            if value is not None:
+                msg = self._flat[(section, sys.intern(key))] = self._format_string(value)
+
+        return msg
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _parse_resources(self, data):
+        """
+        Parses the contents of a resources file into a dictionary of sections, each of which is a dictionary of keys and
+        values. Keys are stored in lower case. Blank lines and lines starting with # or ; are ignored. Keys without a
+        value are stored with a value of None. Names and values are decoded from utf-8 as they are stored, and names are
+        interned. Unsupported lines (key: value lines, indented continuation lines, etc.), duplicate sections and
+        duplicate keys raise an error.
+
+        :param data:
+                The raw (bytes-like) contents of the resources file.
+
+        :return:
+                A dictionary keyed on section name, whose values are dictionaries of key/value pairs.
+        """
+
+        sections = dict()
+        section = None
+
+        for section_name, key, value, bare_key, unsupported in _LINE_RE.findall(data):
+
+            if unsupported:
+                msg = f"Localization file {self.resources_p} is corrupt: It has an unsupported line: "
+                msg += unsupported.decode("utf-8").strip()
+                raise LocalizationError(msg, 6)
+
+            if section_name:
+                section_name = sys.intern(section_name.decode("utf-8").strip())
+                if section_name in sections:
+                    msg = f"Localization file {self.resources_p} is corrupt: It has a duplicate section: "
+                    msg += section_name + "."
+                    raise LocalizationError(msg, 6)
+                section = sections[section_name] = dict()
+                continue
+
+            if section is None:
+                msg = f"Localization file {self.resources_p} is corrupt: It has entries before the first section."
+                raise LocalizationError(msg, 6)
+
+            if key:
+                key = sys.intern(key.decode("utf-8").lower())
+                value = value.decode("utf-8")
+            else:
+                key = sys.intern(bare_key.decode("utf-8").lower())
+                value = None
+
+            if key in section:
+                msg = f"Localization file {self.resources_p} is corrupt: It has a duplicate key: {key}."
+                raise LocalizationError(msg, 6)
+
+            section[key] = value
+
+        return sections
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def has_section(self, section):
+        """
+        Returns whether the resources file contains the given section.
+
+        :param section:
+                The name of the section.
+
+        :return:
+                True if the section exists. False otherwise.
+        """
+
+        return section in self._sections
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def has_option(self, section, option):
+        """
+        Returns whether the given section of the resources file contains the given key. Keys are case insensitive.
+
+        :param section:
+                The name of the section.
+        :param option:
+                The key to look for.
+
+        :return:
+                True if the key exists in the section. False otherwise (including if the section does not exist).
+        """
+
+        return option.lower() in self._sections.get(section, ())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get(self, section, option):
+        """
+        Returns the raw (unformatted) value of the given key in the given section. Keys are case insensitive.
+
+        :param section:
+                The name of the section.
+        :param option:
+                The key whose value should be returned.
+
+        :return:
+                The value as a string, or None if the key was listed without a value.
+        """
 
-        # Open and populate the resources object
-        self.read(self.resources_p)
+        return self._sections[section][option.lower()]
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
     def _format_string(msg):
         """
         Given a string (msg) this will format it with colors based on the {{COLOR}} tags. (example {{COLOR_RED}}). It
-        will also convert literal \n character string into a proper newline.
+        will also convert literal \n character string into a proper newline. All substitutions are done in a single pass
+        over the string.
 
         :param msg:
                 The string to format.
@@ -141,26 +489,12 @@ class LocalizedResource(configparser.SafeConfigParser):
 
         assert type(msg) is str
 
-        output = msg.replace(r"\n", "\n")
-
-        output = output.replace("{{COLOR_BLACK}}", BLACK)
-        output = output.replace("{{COLOR_RED}}", RED)
-        output = output.replace("{{COLOR_GREEN}}", GREEN)
-        output = output.replace("{{COLOR_YELLOW}}", YELLOW)
-        output = output.replace("{{COLOR_BLUE}}", BLUE)
-        output = output.replace("{{COLOR_MAGENTA}}", MAGENTA)
-        output = output.replace("{{COLOR_CYAN}}", CYAN)
-        output = output.replace("{{COLOR_WHITE}}", WHITE)
-        output = output.replace("{{COLOR_BRIGHT_RED}}", BRIGHT_RED)
-        output = output.replace("{{COLOR_BRIGHT_GREEN}}", BRIGHT_GREEN)
-        output = output.replace("{{COLOR_BRIGHT_YELLOW}}", BRIGHT_YELLOW)
-        output = output.replace("{{COLOR_BRIGHT_BLUE}}", BRIGHT_BLUE)
-        output = output.replace("{{COLOR_BRIGHT_MAGENTA}}", BRIGHT_MAGENTA)
-        output = output.replace("{{COLOR_BRIGHT_CYAN}}", BRIGHT_CYAN)
-        output = output.replace("{{COLOR_BRIGHT_WHITE}}", BRIGHT_WHITE)
-        output = output.replace("{{COLOR_NONE}}", ENDC)
+        # Most strings contain no tokens at all, in which case there is nothing to substitute. Every color starts with
+        # "{{" and every escape in _ESCAPE_MAP starts with a backslash.
+        if "{{" not in msg and "\\" not in msg:
+            return msg
 
-        return output
+        return _COLOR_SUB.sub(_expand_token, msg)
 
     # ------------------------------------------------------------------------------------------------------------------
     def get_error_msg(self, code):
@@ -176,16 +510,24 @@ class LocalizedResource(configparser.SafeConfigParser):
 
         assert type(code) is str or type(code) is int
 
-        if not self.has_section("error_codes"):
-            msg = f"Localization file {self.resources_p} is corrupt: It is missing the error_codes section."
-            raise LocalizationError(msg, 2)
+        hit = self._err_cache.get(code)
+        if hit is not None:
+            return hit
 
-        if not self.has_option("error_codes", str(code)):
+        # Only fall back to case folding (and formatting, if not done yet) when the key is not found as given.
+        key = code if type(code) is str else str(code)
+        msg = self._flat.get(("error_codes", key))
+        if msg is None:
+            msg = self._format_value("error_codes", key)
+
+        if msg is None:
+            if not self.has_section("error_codes"):
+                msg = f"Localization file {self.resources_p} is corrupt: It is missing the error_codes section."
+                raise LocalizationError(msg, 2)
             msg = f"Localization file {self.resources_p} is corrupt: It is missing the error_code: {code}."
             raise LocalizationError(msg, 3)
 
-        msg = self.get("error_codes", str(code))
-        msg = self._format_string(msg)
+        self._err_cache[sys.intern(code) if type(code) is str else code] = msg
 
         return msg
 
@@ -203,15 +545,100 @@ class LocalizedResource(configparser.SafeConfigParser):
 
         assert type(message_key) is str
 
-        if not self.has_section("messages"):
-            msg = f"Localization file {self.resources_p} is corrupt: It is missing the messages section."
-            raise LocalizationError(msg, 4)
+        hit = self._msg_cache.get(message_key)
+        if hit is not None:
+            return hit
 
-        if not self.has_option("messages", str(message_key)):
+        # Only fall back to case folding (and formatting, if not done yet) when the key is not found as given.
+        msg = self._flat.get(("messages", message_key))
+        if msg is None:
+            msg = self._format_value("messages", message_key)
+
+        if msg is None:
+            if not self.has_section("messages"):
+                msg = f"Localization file {self.resources_p} is corrupt: It is missing the messages section."
+                raise LocalizationError(msg, 4)
             msg = f"Localization file {self.resources_p} is corrupt: It is missing the message: {message_key}."
             raise LocalizationError(msg, 5)
 
-        msg = self.get("messages", str(message_key))
-        msg = self._format_string(msg)
+        self._msg_cache[sys.intern(message_key)] = msg
 
         return msg
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def preload_errors(self):
+        """
+        Returns every error message in the resources file, already formatted. The returned mapping is read-only and may
+        be shared freely (between threads, for example). If this object is lazy, this formats every value in the file.
+
+        :return:
+                A read-only dictionary of formatted error messages, keyed on the (lower case) error code as a string.
+        """
+
+        self._format_all()
+
+        if "error_codes" not in self._formatted:
+            msg = f"Localization file {self.resources_p} is corrupt: It is missing the error_codes section."
+            raise LocalizationError(msg, 2)
+
+        return types.MappingProxyType(self._formatted["error_codes"])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def preload(self):
+        """
+        Returns every message in the resources file, already formatted. The returned mapping is read-only and may be
+        shared freely (between threads, for example). If this object is lazy, this formats every value in the file.
+
+        :return:
+                A read-only dictionary of formatted messages, keyed on the (lower case) message key.
+        """
+
+        self._format_all()
+
+        if "messages" not in self._formatted:
+            msg = f"Localization file {self.resources_p} is corrupt: It is missing the messages section."
+            raise LocalizationError(msg, 4)
+
+        return types.MappingProxyType(self._formatted["messages"])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def format_error_msg(self, code, /, **kwargs):
+        """
+        Extracts the error message associated with the code and fills in its variables. Equivalent to
+        get_error_msg(code).format(**kwargs): the colors were already expanded when the resources file was read, so
+        filling in the variables is a single str.format_map pass, and a variable can never replace a color.
+
+        :param code:
+                The code for the error message.
+        :param kwargs:
+                The values of any {variable_name} fields in the error message. Code is a positional-only argument, so
+                a variable may also be called "code".
+
+        :return:
+                The formatted string associated with this code.
+        """
+
+        assert type(code) is str or type(code) is int
+
+        return self.get_error_msg(code).format_map(kwargs)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def format_msg(self, message_key, /, **kwargs):
+        """
+        Extracts the message associated with the key and fills in its variables. Equivalent to
+        get_msg(message_key).format(**kwargs): the colors were already expanded when the resources file was read, so
+        filling in the variables is a single str.format_map pass, and a variable can never replace a color.
+
+        :param message_key:
+                The key for the message.
+        :param kwargs:
+                The values of any {variable_name} fields in the message. Message_key is a positional-only argument,
+                so a variable may also be called "message_key".
+
+        :return:
+                A string.
+        """
+
+        assert type(message_key) is str
+
+        return self.get_msg(message_key).format_map(kwargs)
@@ -0,0 +1,92 @@
+"""
+Description
+------------------------------------------------------------------------------------------------------------------------
+Compiles localized resources files into python modules so that they do not need to be parsed or formatted at runtime.
+
+Every <custom_name>_<language>.ini file in the given directory is read, and a <custom_name>_<language>.py module is
+written next to it. The module contains the raw values of the resources file (SECTIONS) and the same values with their
+colors and newlines already expanded (FORMATTED). A LocalizedResource created with compiled=True uses the compiled module
+instead of the .ini file whenever the module is up to date, so the .ini files must still be shipped alongside it.
+
+A compiled module is only up to date if the .ini file still has exactly the modification time and size it had when it
+was compiled (the same rule python uses for .pyc files). Re-run the compiler whenever a resources file changes, and
+after anything that resets modification times (a git checkout, extracting an archive, a copy that does not preserve
+them). A stale compiled module is simply ignored.
+
+Usage:
+
+python -m bvzlocalizationcompile /path/to/resources/
+"""
+
+import os
+import pprint
+import stat
+import sys
+import tempfile
+
+from bvzlocalization import LocalizedResource
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def compile_resources(resources_d):
+    """
+    Compiles every localized resources file in a directory into a python module stored next to it.
+
+    :param resources_d:
+            The directory where the localized resources files are stored.
+
+    :return:
+            A list of the paths to the compiled modules that were written.
+    """
+
+    assert type(resources_d) is str
+
+    output = list()
+
+    for file_n in sorted(os.listdir(resources_d)):
+
+        base_n, ext = os.path.splitext(file_n)
+        if ext != ".ini" or "_" not in base_n:
+            continue
+
+        prefix, language = base_n.rsplit("_", 1)
+        resources_obj = LocalizedResource(resources_d, prefix, language)
+
+        st = os.stat(resources_obj.resources_p)
+        compiled_p = os.path.join(resources_d, base_n + ".py")
+
+        # Write to a temporary file in the same directory and move it into place, so that a program starting up while
+        # this runs never sees a half written module.
+        fd, temp_p = tempfile.mkstemp(prefix="." + base_n + "_", suffix=".tmp", dir=resources_d)
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(f'"""\n'
+                        f'Compiled from {file_n} by bvzlocalizationcompile. Do not edit: edit the .ini file '
+                        f'and compile it again instead.\n'
+                        f'"""\n\n'
+                        f'SOURCE_MTIME_NS = {st.st_mtime_ns}\n\n'
+                        f'SOURCE_SIZE = {st.st_size}\n\n'
+                        f'SECTIONS = {pprint.pformat(resources_obj._sections, width=120, sort_dicts=False)}\n\n'
+                        f'FORMATTED = {pprint.pformat(resources_obj._formatted, width=120, sort_dicts=False)}\n')
+            # mkstemp always creates the file readable by its owner only. Give the module the same permissions as the
+            # .ini file so that other users who can read the resources can also load the compiled version.
+            os.chmod(temp_p, stat.S_IMODE(st.st_mode))
+            os.replace(temp_p, compiled_p)
+        except BaseException:
+            os.unlink(temp_p)
+            raise
+
+        output.append(compiled_p)
+
+    return output
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+
+    if len(sys.argv) != 2:
+        print("Usage: python -m bvzlocalizationcompile /path/to/resources/")
+        sys.exit(1)
+
+    for path in compile_resources(sys.argv[1]):
+        print("Wrote " + path)
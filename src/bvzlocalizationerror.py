@@ -5,7 +5,7 @@ class LocalizationError(Exception):
 
     def __init__(self, message, errno=0):
 
-        super(LocalizationError, self).__init__()
+        super(LocalizationError, self).__init__(message)
 
         self.code = errno
         self.message = message
@@ -0,0 +1,286 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import bvzlocalization  # noqa: E402
+from bvzlocalization import LocalizedResource, RED, BRIGHT_RED, ENDC  # noqa: E402
+from bvzlocalizationcompile import compile_resources  # noqa: E402
+from bvzlocalizationerror import LocalizationError  # noqa: E402
+
+
+SAMPLE = (
+    "# comment\r\n"
+    "; another comment\r\n"
+    "[error_codes]\r\n"
+    "101=This is error {code}\r\n"
+    "102 = {{COLOR_RED}}Bad\\nthing{{COLOR_NONE}} 100%\r\n"
+    "\r\n"
+    "[messages]\r\n"
+    "hello=Hello world.\r\n"
+    "Do_Quit=Do you {{COLOR_BRIGHT_RED}}really{{COLOR_NONE}} want to quit?\r\n"
+    "greet={{COLOR_RED}}Your name is {name}: {{{{literal}}}}{{COLOR_NONE}}\r\n"
+    "url=http://example.com/?a=b\r\n"
+    "empty=\r\n"
+    "bare\r\n"
+)
+
+
+# ======================================================================================================================
+class LocalizedResourceTestCase(unittest.TestCase):
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self.resources_d = tempfile.mkdtemp()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def tearDown(self):
+        shutil.rmtree(self.resources_d)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write(self, text, prefix="app", mtime_ns=None):
+        path = os.path.join(self.resources_d, prefix + "_english.ini")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_parse(self):
+        self.write(SAMPLE)
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        self.assertEqual(resources_obj.get_error_msg(101), "This is error {code}")
+        self.assertEqual(resources_obj.get_error_msg("102"), RED + "Bad\nthing" + ENDC + " 100%")
+        self.assertEqual(resources_obj.get_msg("hello"), "Hello world.")
+        self.assertEqual(resources_obj.get_msg("do_quit"), "Do you " + BRIGHT_RED + "really" + ENDC + " want to quit?")
+        self.assertEqual(resources_obj.get_msg("DO_QUIT"), resources_obj.get_msg("do_quit"))
+        self.assertEqual(resources_obj.get_msg("url"), "http://example.com/?a=b")
+        self.assertEqual(resources_obj.get_msg("empty"), "")
+
+        self.assertTrue(resources_obj.has_section("messages"))
+        self.assertTrue(resources_obj.has_option("messages", "Bare"))
+        self.assertIsNone(resources_obj.get("messages", "bare"))
+        self.assertEqual(resources_obj.get("error_codes", "102"), "{{COLOR_RED}}Bad\\nthing{{COLOR_NONE}} 100%")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_not_utf8(self):
+        with open(os.path.join(self.resources_d, "app_english.ini"), "wb") as f:
+            f.write(b"[messages]\nx=caf\xe9\n")
+
+        with self.assertRaises(LocalizationError) as context:
+            LocalizedResource(self.resources_d, "app")
+        self.assertEqual(context.exception.errno, 6)
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_missing(self):
+        self.write("[messages]\nhello=Hello world.\nbare\n")
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        for function, arg, code in ((resources_obj.get_error_msg, 101, 2),
+                                    (resources_obj.get_msg, "nope", 5),
+                                    (resources_obj.get_msg, "bare", 5)):
+            with self.assertRaises(LocalizationError) as context:
+                function(arg)
+            self.assertEqual(context.exception.errno, code)
+
+        self.write("[error_codes]\n101=Error\n")
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        for function, arg, code in ((resources_obj.get_error_msg, 102, 3),
+                                    (resources_obj.get_msg, "hello", 4)):
+            with self.assertRaises(LocalizationError) as context:
+                function(arg)
+            self.assertEqual(context.exception.errno, code)
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_unsupported(self):
+        for text in ("hello=Hello world.\n",
+                     "[messages]\ncolon: value\n",
+                     "[messages]\nhello=Hello\n  continued\n",
+                     "[messages]\nhello=Hello\nHELLO=again\n",
+                     "[messages]\n[messages]\n",
+                     "[messages]\n=value\n"):
+            self.write(text, prefix="bad")
+            with self.assertRaises(LocalizationError) as context:
+                LocalizedResource(self.resources_d, "bad")
+            self.assertEqual(context.exception.errno, 6, text)
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_cache_invalidation(self):
+        self.write("[messages]\nhello=Hello\n", mtime_ns=1_000_000_000)
+        first_obj = LocalizedResource(self.resources_d, "app")
+        second_obj = LocalizedResource(self.resources_d, "app")
+        self.assertEqual(second_obj.get_msg("hello"), "Hello")
+
+        # Same size, different contents and modification time.
+        self.write("[messages]\nhello=Howdy\n", mtime_ns=2_000_000_000)
+        third_obj = LocalizedResource(self.resources_d, "app")
+
+        self.assertEqual(third_obj.get_msg("hello"), "Howdy")
+        self.assertEqual(first_obj.get_msg("hello"), "Hello")
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_error_code_cache(self):
+        self.write(SAMPLE)
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        msg = resources_obj.get_error_msg(102)
+        self.assertIn(102, resources_obj._err_cache)
+        self.assertIs(resources_obj.get_error_msg(102), msg)
+        self.assertEqual(resources_obj.get_error_msg("102"), msg)
+        self.assertEqual(resources_obj.get_msg("Do_Quit"), resources_obj.get_msg("do_quit"))
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_error(self):
+        error = LocalizationError("Something broke.", 3)
+        self.assertEqual(str(error), "Something broke.")
+
+        error = pickle.loads(pickle.dumps(error))
+        self.assertEqual(error.errno, 3)
+        self.assertEqual(error.message, "Something broke.")
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_preload(self):
+        self.write(SAMPLE)
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        messages = resources_obj.preload()
+        self.assertEqual(messages["do_quit"], resources_obj.get_msg("do_quit"))
+        self.assertNotIn("bare", messages)
+        self.assertEqual(resources_obj.preload_errors()["102"], resources_obj.get_error_msg(102))
+
+        with self.assertRaises(TypeError):
+            messages["hello"] = "Changed."
+        with self.assertRaises(TypeError):
+            resources_obj.preload_errors()["101"] = "Changed."
+        self.assertEqual(resources_obj.get_msg("hello"), "Hello world.")
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_lazy_matches_eager(self):
+        self.write(SAMPLE)
+        eager_obj = LocalizedResource(self.resources_d, "app")
+        lazy_obj = LocalizedResource(self.resources_d, "app", lazy=True)
+
+        for key in eager_obj.preload():
+            self.assertEqual(lazy_obj.get_msg(key), eager_obj.get_msg(key))
+        for code in eager_obj.preload_errors():
+            self.assertEqual(lazy_obj.get_error_msg(code), eager_obj.get_error_msg(code))
+
+        self.assertEqual(dict(lazy_obj.preload()), dict(eager_obj.preload()))
+        self.assertEqual(dict(lazy_obj.preload_errors()), dict(eager_obj.preload_errors()))
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_format_msg(self):
+        self.write(SAMPLE)
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        self.assertEqual(resources_obj.format_msg("greet", name="Bob"),
+                         resources_obj.get_msg("greet").format(name="Bob"))
+        self.assertEqual(resources_obj.format_msg("Do_Quit"), resources_obj.get_msg("do_quit").format())
+        self.assertEqual(resources_obj.format_error_msg(101, code=7), resources_obj.get_error_msg(101).format(code=7))
+        self.assertEqual(resources_obj.format_error_msg("102"), resources_obj.get_error_msg(102).format())
+
+        with self.assertRaises(LocalizationError) as context:
+            resources_obj.format_msg("nope")
+        self.assertEqual(context.exception.errno, 5)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_format_msg_colors(self):
+        self.write("[messages]\nred={{COLOR_RED}}{v}\nsingle={COLOR_RED}x\n")
+        resources_obj = LocalizedResource(self.resources_d, "app")
+
+        # A variable named like a color does not replace the color.
+        self.assertEqual(resources_obj.format_msg("red", v=1, COLOR_RED="Z"), RED + "1")
+        self.assertEqual(resources_obj.format_msg("red", v=1, COLOR_RED="Z"),
+                         resources_obj.get_msg("red").format(v=1, COLOR_RED="Z"))
+
+        # A color written with single braces is an ordinary (here missing) variable.
+        with self.assertRaises(KeyError):
+            resources_obj.get_msg("single").format()
+        with self.assertRaises(KeyError):
+            resources_obj.format_msg("single")
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_missing_file(self):
+        self.write("[messages]\nhello=Hello world.\n")
+
+        with self.assertRaises(LocalizationError) as context:
+            LocalizedResource(self.resources_d, "app", "french")
+        self.assertEqual(context.exception.errno, 1)
+
+        with self.assertRaises(LocalizationError) as context:
+            LocalizedResource(os.path.join(self.resources_d, "nodir"), "app")
+        self.assertEqual(context.exception.errno, 0)
+
+        # Permission errors cannot be provoked reliably (root ignores file modes), so simulate them.
+        for function_n in ("stat", "open"):
+            with mock.patch("bvzlocalization.os." + function_n, side_effect=PermissionError(13, "Permission denied")):
+                with self.assertRaises(LocalizationError) as context:
+                    LocalizedResource(self.resources_d, "app")
+            self.assertEqual(context.exception.errno, 1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_compile_mode(self):
+        ini_p = self.write(SAMPLE)
+        os.chmod(ini_p, 0o644)
+
+        compiled_p, = compile_resources(self.resources_d)
+        self.assertEqual(os.stat(compiled_p).st_mode & 0o777, 0o644)
+        self.assertEqual(sorted(os.listdir(self.resources_d)), ["app_english.ini", "app_english.py"])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_compiled(self):
+        self.write(SAMPLE, mtime_ns=1_000_000_000)
+        compiled_p, = compile_resources(self.resources_d)
+        with open(compiled_p, "a", encoding="utf-8") as f:
+            f.write('FORMATTED["messages"]["hello"] = "Compiled."\n')
+
+        # The compiled module is only used when asked for.
+        bvzlocalization._PARSE_CACHE.clear()
+        self.assertEqual(LocalizedResource(self.resources_d, "app").get_msg("hello"), "Hello world.")
+        bvzlocalization._PARSE_CACHE.clear()
+        resources_obj = LocalizedResource(self.resources_d, "app", compiled=True)
+        self.assertEqual(resources_obj.get_msg("hello"), "Compiled.")
+        self.assertEqual(resources_obj.get_msg("do_quit"), "Do you " + BRIGHT_RED + "really" + ENDC + " want to quit?")
+
+        # A module compiled from a file with a different modification time is stale.
+        self.write(SAMPLE, mtime_ns=2_000_000_000)
+        bvzlocalization._PARSE_CACHE.clear()
+        self.assertEqual(LocalizedResource(self.resources_d, "app", compiled=True).get_msg("hello"), "Hello world.")
+
+        # A module that cannot be loaded is ignored, but not silently.
+        compile_resources(self.resources_d)
+        with open(compiled_p, "r+", encoding="utf-8") as f:
+            f.truncate(os.path.getsize(compiled_p) // 2)
+        bvzlocalization._PARSE_CACHE.clear()
+        with self.assertWarns(RuntimeWarning):
+            resources_obj = LocalizedResource(self.resources_d, "app", compiled=True)
+        self.assertEqual(resources_obj.get_msg("hello"), "Hello world.")
+
+        # Without a module, nothing is imported.
+        os.unlink(compiled_p)
+        bvzlocalization._PARSE_CACHE.clear()
+        with mock.patch("bvzlocalization.importlib.util.spec_from_file_location") as spec_from_file_location:
+            LocalizedResource(self.resources_d, "app", compiled=True)
+        spec_from_file_location.assert_not_called()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    unittest.main()